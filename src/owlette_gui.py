@@ -9,7 +9,6 @@ import os
 import signal
 import json
 from email_validator import validate_email, EmailNotValidError
-from google_auth_oauthlib.flow import InstalledAppFlow
 import keyring
 import logging
 import uuid
@@ -40,8 +39,13 @@ class OwletteConfigApp:
         # Load existing config after defining email entry widgets
         self.config = shared_utils.load_config(self.emails_to_entry)
 
+        # Only allow one Google OAuth flow / Slack setup at a time
+        self.google_auth_lock = threading.Lock()
+        self.slack_setup_in_progress = threading.Event()
+
         # Process list
         self.prev_process_list = None
+        self.prev_file_stamps = None
         self.selected_process = None
         self.selected_index = None
         self.update_process_list()
@@ -284,15 +288,16 @@ class OwletteConfigApp:
 
     def toggle_launch_process(self):
         if self.selected_process:
-            index = shared_utils.get_process_index(self.selected_process)
+            index = shared_utils.get_process_index(self.selected_process, self.config)
             current_state = self.config['processes'][index].get('autolaunch', False)
             self.config['processes'][index]['autolaunch'] = not current_state
             shared_utils.save_config(self.config)
 
             # Status message if process has been launched
             try:
-                pid = shared_utils.fetch_pid_by_id(self.config['processes'][index]['id'])
-                shared_utils.update_process_status_in_json(pid, 'UNKNOWN' if current_state else 'QUEUED')
+                status_data = shared_utils.read_json_from_file(shared_utils.RESULT_FILE_PATH)
+                pid = shared_utils.fetch_pid_by_id(self.config['processes'][index]['id'], status_data)
+                shared_utils.update_process_status_in_json(pid, 'UNKNOWN' if current_state else 'QUEUED', status_data)
             except Exception as e:
                 logging.info(e)
 
@@ -362,7 +367,7 @@ class OwletteConfigApp:
                 CTkMessagebox(master=self.master, title="Validation Error", message="Name and Exe Path are required fields.", icon="cancel")
                 return
 
-            index = shared_utils.get_process_index(self.selected_process)
+            index = shared_utils.get_process_index(self.selected_process, self.config)
 
             self.config['processes'][index]['name'] = name
             self.config['processes'][index]['exe_path'] = exe_path
@@ -374,14 +379,16 @@ class OwletteConfigApp:
             self.config['processes'][index]['time_to_init'] = time_to_init
             self.config['processes'][index]['relaunch_attempts'] = relaunch_attempts
 
-            shared_utils.save_config(self.config)
+        # Always update email config, then save process and email changes in one write
+        self.update_email_config(save=False)
+        shared_utils.save_config(self.config)
+
+        if self.selected_process:
             self.update_process_list()
 
             # Re-select the process
             self.process_list.activate(index)
 
-        self.update_email_config()  # Always update email config
-
         self.master.focus_set() # Defocus from the entry widget back to root
 
     def add_process(self):
@@ -506,18 +513,26 @@ class OwletteConfigApp:
         # Get currently selected item from process list
         self.selected_index = self.process_list.curselection()
 
-        status_data = shared_utils.read_json_from_file(shared_utils.RESULT_FILE_PATH)
-        config = shared_utils.read_config()
-        updated_config = self.map_status_to_config(status_data, config)
-        
-        new_list = [f"{process['status']} - {process['name']}" for process in updated_config['processes']]
+        # Only re-read the status and config files if one of them has changed
+        try:
+            file_stamps = tuple(os.stat(path).st_mtime_ns for path in (shared_utils.RESULT_FILE_PATH, shared_utils.CONFIG_PATH))
+        except OSError:
+            file_stamps = None
 
-        if new_list != self.prev_process_list:
-            if self.process_list.size() > 0:
-                self.process_list.delete(0, 'end')  # Clear the existing listbox items
-            for item in new_list:
-                self.process_list.insert('end', item)
-            self.prev_process_list = new_list  # Update the previous list
+        if file_stamps is None or file_stamps != self.prev_file_stamps:
+            status_data = shared_utils.read_json_from_file(shared_utils.RESULT_FILE_PATH)
+            config = shared_utils.read_config()
+            updated_config = self.map_status_to_config(status_data, config)
+            self.prev_file_stamps = file_stamps
+
+            new_list = [f"{process['status']} - {process['name']}" for process in updated_config['processes']]
+
+            if new_list != self.prev_process_list:
+                if self.process_list.size() > 0:
+                    self.process_list.delete(0, 'end')  # Clear the existing listbox items
+                for item in new_list:
+                    self.process_list.insert('end', item)
+                self.prev_process_list = new_list  # Update the previous list
 
         # Try to reselect process list item automatically (if not editing an entry)
         if self.selected_index is not None and current_focus == '.' or current_focus is None:
@@ -537,7 +552,7 @@ class OwletteConfigApp:
                 process_name = shared_utils.fetch_process_name_by_id(self.selected_process, self.config)
                 response = CTkMessagebox(master=self.master, title="Remove Process?", message=f"Are you sure you want to remove {process_name}?", icon="question", option_1="Yes", option_2="No")
                 if response.get() == 'Yes':
-                    index = shared_utils.get_process_index(self.selected_process)
+                    index = shared_utils.get_process_index(self.selected_process, self.config)
                     if index is not None:
                         del self.config['processes'][index]
                         shared_utils.save_config(self.config)
@@ -549,7 +564,7 @@ class OwletteConfigApp:
 
     def move_up(self):
         if self.selected_process:
-            index = shared_utils.get_process_index(self.selected_process)
+            index = shared_utils.get_process_index(self.selected_process, self.config)
             if index > 0:
                 self.config['processes'][index], self.config['processes'][index-1] = self.config['processes'][index-1], self.config['processes'][index]
                 shared_utils.save_config(self.config)
@@ -560,7 +575,7 @@ class OwletteConfigApp:
 
     def move_down(self):
         if self.selected_process:
-            index = shared_utils.get_process_index(self.selected_process)
+            index = shared_utils.get_process_index(self.selected_process, self.config)
             if index < len(self.config['processes']) - 1:
                 self.config['processes'][index], self.config['processes'][index+1] = self.config['processes'][index+1], self.config['processes'][index]
                 shared_utils.save_config(self.config)
@@ -621,7 +636,7 @@ class OwletteConfigApp:
             CTkMessagebox(master=self.master, title='Email address invalid', message=f"{e}", icon="cancel")
             return False
 
-    def update_email_config(self, event=None):
+    def update_email_config(self, event=None, save=True):
         emails_to = self.emails_to_entry.get().split(',')
         for email in emails_to:
             if email.strip():  # Skip validation for empty items in the list
@@ -629,7 +644,8 @@ class OwletteConfigApp:
                     return
 
         self.config['gmail']['to'] = [email.strip() for email in emails_to]
-        shared_utils.save_config(self.config)
+        if save:
+            shared_utils.save_config(self.config)
 
     def send_confirmation_email(self):
         try:
@@ -648,28 +664,40 @@ class OwletteConfigApp:
             logging.error(f'Error sending confirmation email: {e}')
 
     def get_google_auth_token(self):
-        refresh_token = keyring.get_password("Owlette", "GmailRefreshToken")
-        if not refresh_token:
-            try:
-                # Initialize the flow
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    shared_utils.get_path('../config/client_secrets.json'),
-                    scopes=['https://www.googleapis.com/auth/gmail.send']
-                )
-                # Run the flow
-                credentials = flow.run_local_server(port=0)
-                # Store the token in Windows Credentials
-                keyring.set_password("Owlette", "GmailRefreshToken", credentials.refresh_token)
-                logging.info('Added Gmail Refresh Token to Windows Credentials')
+        # If a flow is already running (e.g. Gmail toggled twice), let it finish
+        if not self.google_auth_lock.acquire(blocking=False):
+            logging.info('Gmail authentication already in progress')
+            return
 
-                self.send_confirmation_email()
+        try:
+            refresh_token = keyring.get_password("Owlette", "GmailRefreshToken")
+            if not refresh_token:
+                try:
+                    # Imported here since the Google auth stack is slow to load and only needed for this flow
+                    from google_auth_oauthlib.flow import InstalledAppFlow
+
+                    # Initialize the flow
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        shared_utils.get_path('../config/client_secrets.json'),
+                        scopes=['https://www.googleapis.com/auth/gmail.send']
+                    )
+                    # Run the flow
+                    # Bind the redirect listener to IPv4 loopback directly (no 'localhost' lookup)
+                    credentials = flow.run_local_server(host='localhost', bind_addr='127.0.0.1', port=0)
+                    # Store the token in Windows Credentials
+                    keyring.set_password("Owlette", "GmailRefreshToken", credentials.refresh_token)
+                    logging.info('Added Gmail Refresh Token to Windows Credentials')
+
+                    self.send_confirmation_email()
 
-            except Exception as e:
-                logging.error(f'Gmail Authentication Error: {e}')
+                except Exception as e:
+                    logging.error(f'Gmail Authentication Error: {e}')
 
-        # If token stored, send test email as confirmation
-        else:
-            self.send_confirmation_email()
+            # If token stored, send test email as confirmation
+            else:
+                self.send_confirmation_email()
+        finally:
+            self.google_auth_lock.release()
             
     def start_google_auth_thread(self):
         auth_thread = threading.Thread(target=self.get_google_auth_token)
@@ -680,7 +708,7 @@ class OwletteConfigApp:
 
     def toggle_slack(self):
         if self.slack_toggle.get() == 'on':
-            self.setup_slack()
+            self.start_slack_setup_thread()
             self.config['slack']['enabled'] = True
         else:
             self.config['slack']['enabled'] = False
@@ -706,11 +734,36 @@ class OwletteConfigApp:
             # Post a confirmation Slack message
             msg = f":owl: Hoo hoo! from :computer: {shared_utils.get_hostname()}\n> :wave: I'm connected to Slack :thumbsup: What a _hoot_!"
             if owlette_slack.send_message(msg):
-                # message success, Slack is configured, set to true in JSON
-                shared_utils.write_config(['slack', 'enabled'], True)
+                # message success, Slack is configured; finish up on the UI thread
+                self.master.after(0, self.finish_slack_setup)
+
+    def finish_slack_setup(self):
+        # The user may have switched Slack off while setup was running; don't turn it back on
+        if self.slack_toggle.get() != 'on':
+            return
+
+        # Slack is configured, set to true in JSON
+        shared_utils.write_config(['slack', 'enabled'], True)
+
+        # Let the user know that we really did send a message to their slack
+        CTkMessagebox(master=self.master, title="Success", message="Message delivered. Please check your Slack in the #owlette channel.")
+
+    def run_slack_setup(self):
+        try:
+            self.setup_slack()
+        finally:
+            self.slack_setup_in_progress.clear()
+
+    def start_slack_setup_thread(self):
+        # If a setup is already running (e.g. Slack toggled twice), let it finish
+        if self.slack_setup_in_progress.is_set():
+            return
+        self.slack_setup_in_progress.set()
 
-                # Let the user know that we really did send a message to their slack
-                CTkMessagebox(master=self.master, title="Success", message="Message delivered. Please check your Slack in the #owlette channel.")
+        # Token prompt, channel setup and test message all block; keep them off the UI thread
+        slack_thread = threading.Thread(target=self.run_slack_setup)
+        slack_thread.daemon = True  # This ensures the thread will exit when the main program exits
+        slack_thread.start()
 
     # UI
 
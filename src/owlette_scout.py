@@ -23,7 +23,6 @@ def is_app_responsive(pid):
 
 # Get the PID from command-line arguments
 pid = int(sys.argv[1])
-current_time = int(time.time())  # Get the current timestamp
 result = True
 
 # Read existing results from the output file
@@ -32,7 +31,7 @@ results = shared_utils.read_json_from_file(shared_utils.RESULT_FILE_PATH)
 # Check if the process has a timestamp and if it's older than 60 seconds
 process_info = results.get(str(pid), {})
 timestamp = process_info.get('timestamp', 0)
-current_time = int(time.time())
+current_time = int(time.time())  # Get the current timestamp
 time_since_launch = current_time - timestamp
 
 if time_since_launch < 60:
@@ -41,10 +40,13 @@ if time_since_launch < 60:
 else:
     result = is_app_responsive(pid)
 
-    # Update the results dictionary
-    if str(pid) not in results:
-        results[str(pid)] = {}
-    results[str(pid)]['responsive'] = result
+    # Only write back when the responsive flag changed, so we don't overwrite
+    # updates the service made since we read the file
+    if process_info.get('responsive') != result:
+        # Update the results dictionary
+        if str(pid) not in results:
+            results[str(pid)] = {}
+        results[str(pid)]['responsive'] = result
 
-# Write the updated results back to the output file
-shared_utils.write_json_to_file(results, shared_utils.RESULT_FILE_PATH)
\ No newline at end of file
+        # Write the updated results back to the output file
+        shared_utils.write_json_to_file(results, shared_utils.RESULT_FILE_PATH)
\ No newline at end of file
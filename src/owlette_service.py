@@ -12,7 +12,6 @@ import logging
 import psutil
 import time
 import json
-import datetime
 
 """
 To install/run this as a service, 
@@ -26,6 +25,14 @@ LOG_FILE_PATH = shared_utils.get_path('../logs/service.log')
 MAX_RELAUNCH_ATTEMPTS = 3
 SLEEP_INTERVAL = 10
 TIME_TO_INIT = 60
+PRIORITY_CLASSES = {
+    "Low": win32con.IDLE_PRIORITY_CLASS,
+    #"Below Normal": win32con.BELOW_NORMAL_PRIORITY_CLASS, # doesn't seem to work?
+    "Normal": win32con.NORMAL_PRIORITY_CLASS,
+    #"Above Normal": win32con.ABOVE_NORMAL_PRIORITY_CLASS, # doesn't seem to work?
+    "High": win32con.HIGH_PRIORITY_CLASS,
+    "Realtime": win32con.REALTIME_PRIORITY_CLASS
+}
 
 # Utility functions
 class Util:
@@ -39,11 +46,8 @@ class Util:
     # Check if a Process ID (PID) is running
     @staticmethod
     def is_pid_running(pid):
-        try:
-            process = psutil.Process(pid)
-            return True
-        except psutil.NoSuchProcess:
-            return False
+        # pid_exists returns a bool instead of raising NoSuchProcess for dead PIDs
+        return psutil.pid_exists(pid)
 
     @staticmethod
     def get_process_name(process):
@@ -72,7 +76,10 @@ class OwletteService(win32serviceutil.ServiceFramework):
         self.first_start = True # First start of this service
         self.last_started = {} # Last time a process was started
         self.results = {} # App process response esults
-        self.current_time = datetime.datetime.now()
+        self.config = None # Config JSON, reloaded when the file changes
+        self.config_mtime = None # Modification time of the loaded config
+        self.running_scripts = set() # Helper scripts seen running this loop
+        self.current_time = time.monotonic() # Monotonic clock, only used for elapsed time
 
     # On service stop
     def SvcStop(self):
@@ -99,11 +106,11 @@ class OwletteService(win32serviceutil.ServiceFramework):
         logging.error(reason)
 
         # Slack
-        if shared_utils.read_config(['slack', 'enabled']):
+        if shared_utils.read_config(['slack', 'enabled'], config=self.config):
             self.send_notification('slack', process_name, reason)
         
         # Email
-        if shared_utils.read_config(['gmail', 'enabled']):
+        if shared_utils.read_config(['gmail', 'enabled'], config=self.config):
             self.send_notification('gmail', process_name, reason)
     
     # Terminate the tray icon process if it exists
@@ -168,15 +175,7 @@ class OwletteService(win32serviceutil.ServiceFramework):
 
         # Map process priority, default is normal
         priority = process.get('priority', 'Normal')
-        priority_mapping = {
-            "Low": win32con.IDLE_PRIORITY_CLASS,
-            #"Below Normal": win32con.BELOW_NORMAL_PRIORITY_CLASS, # doesn't seem to work?
-            "Normal": win32con.NORMAL_PRIORITY_CLASS,
-            #"Above Normal": win32con.ABOVE_NORMAL_PRIORITY_CLASS, # doesn't seem to work?
-            "High": win32con.HIGH_PRIORITY_CLASS,
-            "Realtime": win32con.REALTIME_PRIORITY_CLASS
-        }
-        priority_class = priority_mapping.get((priority), win32con.NORMAL_PRIORITY_CLASS)
+        priority_class = PRIORITY_CLASSES.get(priority, win32con.NORMAL_PRIORITY_CLASS)
 
         # Show or hide window!
         self.startup_info.wShowWindow = win32con.SW_SHOW if visibility == 'Show' else win32con.SW_HIDE
@@ -264,13 +263,12 @@ class OwletteService(win32serviceutil.ServiceFramework):
         try:
             attempts = self.relaunch_attempts.get(process_name, 0 if self.first_start else 1)
 
-            process_list_id = shared_utils.fetch_process_id_by_name(process_name, shared_utils.read_config())
-            relaunches_to_attempt = int(shared_utils.read_config(keys=['relaunch_attempts'], process_list_id=process_list_id))
+            relaunches_to_attempt = int(process.get('relaunch_attempts'))
             if not relaunches_to_attempt:
                 relaunches_to_attempt = MAX_RELAUNCH_ATTEMPTS
 
             # Check if restart prompt is running
-            if not shared_utils.is_script_running('prompt_restart.py'):
+            if 'prompt_restart.py' not in self.running_scripts:
                 # If attempts are less than or equal to the relaunch attempts, log it
                 if 0 < attempts <= relaunches_to_attempt:
                     self.log_and_notify(
@@ -285,6 +283,7 @@ class OwletteService(win32serviceutil.ServiceFramework):
                         None
                     )
                     if started_restart_prompt:
+                        self.running_scripts.add('prompt_restart.py')
                         self.log_and_notify(
                             process,
                             f'Terminated {process_name} {relaunches_to_attempt} times. System reboot imminent'
@@ -319,8 +318,7 @@ class OwletteService(win32serviceutil.ServiceFramework):
                     process,
                     f'Terminated PID {pid} and restarted with new PID {new_pid}'
                 )
-                # Status message
-                shared_utils.update_process_status_in_json(new_pid, 'LAUNCHING')
+                # Status is already set to LAUNCHING by launch_process_as_user
                 
                 return new_pid
 
@@ -339,13 +337,13 @@ class OwletteService(win32serviceutil.ServiceFramework):
             delay = float(process.get('time_delay', 0))
             
             # Fetch the time to init (how long to give the app to initialize itself / start up)
-            time_to_init = float(shared_utils.read_config(keys=['time_to_init'], process_list_id=process_list_id))
+            time_to_init = float(process.get('time_to_init'))
 
             # Give the app time to launch (if it's launching for the first time)
             last_info = self.last_started.get(process_list_id, {})
             last_time = last_info.get('time')
                         
-            if last_time is None or (last_time is not None and (self.current_time - last_time).total_seconds() >= (time_to_init or TIME_TO_INIT)):
+            if last_time is None or (last_time is not None and self.current_time - last_time >= (time_to_init or TIME_TO_INIT)):
                 # Delay starting of the app (if applicable)
                 time.sleep(delay)
 
@@ -435,21 +433,28 @@ class OwletteService(win32serviceutil.ServiceFramework):
 
         # The heart of Owlette
         while self.is_alive:
+            # Scan the process table once for the helper scripts we check this loop
+            self.running_scripts = shared_utils.get_running_scripts(['owlette_tray.py', 'prompt_restart.py'])
+
             # Start the tray icon script as a process (if it isn't running)
             tray_script = 'owlette_tray.py'
-            if not shared_utils.is_script_running(tray_script):
+            if tray_script not in self.running_scripts:
                 self.launch_python_script_as_user(tray_script)
 
-            # Get the current time
-            self.current_time = datetime.datetime.now()
+            # Get the current time (monotonic, so clock changes don't skew launch timing)
+            self.current_time = time.monotonic()
 
             # Load in latest results from the output file
             content = shared_utils.read_json_from_file(shared_utils.RESULT_FILE_PATH)
             if content:
                 self.results = content
 
-            # Load in all processes in config json
-            processes = shared_utils.read_config(['processes'])
+            # Reload config json only if the file changed; handlers below reuse it
+            config_mtime = os.stat(shared_utils.CONFIG_PATH).st_mtime_ns
+            if self.config is None or config_mtime != self.config_mtime:
+                self.config = shared_utils.read_config()
+                self.config_mtime = config_mtime
+            processes = self.config['processes']
             for process in processes:
                 if process.get('autolaunch', False): # Default to False if not found
                     self.handle_process(process)
@@ -459,8 +464,8 @@ class OwletteService(win32serviceutil.ServiceFramework):
 
             self.first_start = False
 
-            # Sleep for 10 seconds
-            time.sleep(SLEEP_INTERVAL)
+            # Sleep for 10 seconds, waking immediately if the service is stopped
+            win32event.WaitForSingleObject(self.hWaitStop, SLEEP_INTERVAL * 1000)
 
 if __name__ == '__main__':
     win32serviceutil.HandleCommandLine(OwletteService)
@@ -1,19 +1,27 @@
 import keyring
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import shared_utils
 import argparse
 
-# Load logging
-shared_utils.initialize_logging("slack")
-
-# Take an input of the app name that was restarted
-parser = argparse.ArgumentParser(description='Send Slack notifications.')
-parser.add_argument('--process_name', type=str, help='Name of the process to notify about')
-parser.add_argument('--reason', type=str, help='Reason for the Slack notification')
-args = parser.parse_args()
-process_name = args.process_name
-reason = args.reason
+# Retry only rate-limited (429) responses, honoring Slack's Retry-After. A 5xx or read
+# timeout on a POST may mean the message was already delivered, so those are not retried.
+retries = Retry(
+    total=3,
+    read=0,
+    backoff_factor=1.0,
+    status_forcelist=(429,),
+    allowed_methods=frozenset(['GET', 'POST']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Share one HTTP session across Slack API calls so the TLS connection is reused
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+session.headers.update({'User-Agent': f'Owlette/{shared_utils.APP_VERSION}'})
 
 def get_cred(name, item):
     cred = keyring.get_password(name, item)
@@ -23,9 +31,13 @@ def get_cred(name, item):
     else:
         return cred
 
+# Decode only the start of a response body for logging (error pages can be large)
+def short_body(response, limit=512):
+    return response.content[:limit].decode('utf-8', errors='replace')
+
 def slack_api_call(method, url, token, params=None, json=None):
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.request(method, url, headers=headers, params=params, json=json)
+    response = session.request(method, url, headers=headers, params=params, json=json)
     
     if response.status_code == 200:
         response_json = response.json()
@@ -35,7 +47,7 @@ def slack_api_call(method, url, token, params=None, json=None):
             logging.error(f"Slack API Error: {response_json.get('error')}")
             return None
     else:
-        logging.error(f"HTTP Error: {response.status_code}")
+        logging.error(f"HTTP Error: {response.status_code} {short_body(response)}")
         return None
 
 def get_workspace_owner_id(token):
@@ -150,9 +162,21 @@ def send_message(message_text):
         
         return channel_id
 
-try:
-    if process_name is not None and reason is not None:
-        send_message(f":computer: Computer: *{shared_utils.get_hostname()}*\n> :carpentry_saw: Process: *{process_name}*\n> :pencil2: Status: *{reason}*")
+if __name__ == "__main__":
+    # Load logging
+    shared_utils.initialize_logging("slack")
+
+    # Take an input of the app name that was restarted
+    parser = argparse.ArgumentParser(description='Send Slack notifications.')
+    parser.add_argument('--process_name', type=str, help='Name of the process to notify about')
+    parser.add_argument('--reason', type=str, help='Reason for the Slack notification')
+    args = parser.parse_args()
+    process_name = args.process_name
+    reason = args.reason
+
+    try:
+        if process_name is not None and reason is not None:
+            send_message(f":computer: Computer: *{shared_utils.get_hostname()}*\n> :carpentry_saw: Process: *{process_name}*\n> :pencil2: Status: *{reason}*")
 
-except Exception as e:
-    logging.error(e)
\ No newline at end of file
+    except Exception as e:
+        logging.error(e)
\ No newline at end of file
@@ -3,15 +3,15 @@ import os
 import shared_utils
 
 class PromptRestart:
-    FRAME_COLOR = '#28292b'
-    BUTTON_COLOR = '#374448'
-    BUTTON_HOVER_COLOR = '#27424a'
+    FRAME_COLOR = shared_utils.FRAME_COLOR
+    BUTTON_COLOR = shared_utils.BUTTON_COLOR
+    BUTTON_HOVER_COLOR = shared_utils.BUTTON_HOVER_COLOR
     WINDOW_WIDTH = 400
     WINDOW_HEIGHT = 200
 
     def __init__(self, master):
         self.master = master
-        self.master.title("Process repeatedly failing!")
+        self.master.title(shared_utils.WINDOW_TITLES.get("prompt_restart"))
         shared_utils.center_window(master, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
         self.master.lift()
         self.master.focus_force()
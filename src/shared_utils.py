@@ -10,7 +10,8 @@ import GPUtil
 import platform
 import subprocess
 import threading
-import psutil
+import time
+import tempfile
 
 # GLOBAL VARS
 
@@ -28,6 +29,7 @@ WINDOW_TITLES = {
     "prompt_restart": "Process repeatedly failing!"
 }
 SERVICE_NAME = 'OwletteService'
+REPLACE_ATTEMPTS = 6 # Retries (with backoff) when swapping in a JSON file that's in use
 
 
 # OS
@@ -52,13 +54,16 @@ def get_path(filename=None):
     return path
 
 def is_script_running(script_name):
+    return script_name in get_running_scripts([script_name])
+
+# Check several scripts with a single pass over the process table
+def get_running_scripts(script_names):
+    running = set()
     for process in psutil.process_iter(attrs=['pid', 'name', 'cmdline']):
-        print(process.info['name'])
-        print(script_name)
         if 'python' in process.info['name']:
-            if script_name in ' '.join(process.info['cmdline']):
-                return True
-    return False
+            cmdline = ' '.join(process.info['cmdline'] or [])
+            running.update(name for name in script_names if name in cmdline)
+    return running
 
 # PATHS
 CONFIG_PATH = get_path('../config/config.json')
@@ -69,16 +74,15 @@ RESULT_FILE_PATH = get_path('../tmp/app_states.json')
 def initialize_logging(log_file_name, level=logging.INFO):
     log_file_path = get_path(f'../logs/{log_file_name}.log')
     
-    # Clear the log file
-    with open(log_file_path, 'w'):
-        pass
-    
     # Create a formatter for the log messages
     log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     
     # Create a handler that writes log messages to a file, with a maximum
     # log file size of 5 MB, keeping 2 old log files.
     log_handler = RotatingFileHandler(log_file_path, mode='a', maxBytes=5*1024*1024, backupCount=2, encoding=None, delay=0)
+
+    # Clear the log file through the handler's stream instead of opening it twice
+    log_handler.stream.truncate(0)
     
     # Set the formatter for the handler
     log_handler.setFormatter(log_formatter)
@@ -193,8 +197,37 @@ def read_json_from_file(file_path):
 def write_json_to_file(data, file_path):
     with json_lock:
         try:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=4)
+            # Serialize up front so the file is written in one call
+            contents = json.dumps(data, indent=4)
+
+            # Skip the write entirely if the file already holds this exact content
+            try:
+                with open(file_path, 'r') as f:
+                    if f.read() == contents:
+                        return
+            except FileNotFoundError:
+                pass
+
+            # Write to a unique temp file in the same directory and swap it in, so readers
+            # in other processes (service, scout, GUI) never see a half-written file
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(contents)
+                for attempt in range(REPLACE_ATTEMPTS):
+                    try:
+                        os.replace(temp_path, file_path)
+                        return
+                    except PermissionError:
+                        # On Windows the target can't be replaced while a reader has it open
+                        time.sleep(0.01 * 2 ** attempt)
+
+                # Still held open after all retries: write in place rather than drop the update
+                with open(file_path, 'w') as f:
+                    f.write(contents)
+            finally:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
         except Exception as e:
             logging.error(f"An error occurred while writing to the file: {e}")
 
@@ -222,9 +255,11 @@ def generate_config_file(existing_config=None):
 
     return existing_config
 
-# Read specific keys from the configuration file or a specific process by its ID
-def read_config(keys=None, process_list_id=None):
-    config = read_json_from_file(CONFIG_PATH)
+# Read specific keys from the configuration file or a specific process by its ID.
+# Pass an already loaded config to look values up without re-reading the file.
+def read_config(keys=None, process_list_id=None, config=None):
+    if config is None:
+        config = read_json_from_file(CONFIG_PATH)
 
     # If process_list_id is provided, find the corresponding process
     if process_list_id:
@@ -267,8 +302,10 @@ def write_config(keys, value):
 
 # PROCESSES
 
-def fetch_pid_by_id(target_id):
-    data = read_json_from_file(RESULT_FILE_PATH)
+# Pass already loaded app states as data to avoid re-reading the results file
+def fetch_pid_by_id(target_id, data=None):
+    if data is None:
+        data = read_json_from_file(RESULT_FILE_PATH)
     
     # Filter out the processes that match the target_id
     matching_processes = {pid: info for pid, info in data.items() if info['id'] == target_id}
@@ -282,8 +319,9 @@ def fetch_pid_by_id(target_id):
     
     return newest_pid
 
-def update_process_status_in_json(pid, new_status):
-    data = read_json_from_file(RESULT_FILE_PATH)
+def update_process_status_in_json(pid, new_status, data=None):
+    if data is None:
+        data = read_json_from_file(RESULT_FILE_PATH)
     data[str(pid)]['status'] = new_status
     write_json_to_file(data, RESULT_FILE_PATH)
 
@@ -298,8 +336,11 @@ def fetch_process_id_by_name(name, data):
     process = next((process for process in data['processes'] if process['name'] == name), None)
     return process['id'] if process else None
 
-def get_process_index(selected_process_id):
-    return next((i for i, p in enumerate(read_config()['processes']) if p['id'] == selected_process_id), None)
+# Pass an already loaded config to avoid re-reading the file
+def get_process_index(selected_process_id, config=None):
+    if config is None:
+        config = read_config()
+    return next((i for i, p in enumerate(config['processes']) if p['id'] == selected_process_id), None)
 
 # WINDOWS / UI
 